@@ -9,7 +9,6 @@ from rest_framework.request import Request
 from sentry import features
 from sentry.api.serializers.rest_framework.base import CamelSnakeModelSerializer
 from sentry.api.validators.external_actor import (
-    is_valid_provider,
     validate_external_id_option,
     validate_external_name,
     validate_integration_id,
@@ -21,20 +20,31 @@ from sentry.models.team import Team
 from sentry.services.hybrid_cloud.organization import organization_service
 from sentry.services.hybrid_cloud.user import RpcUser
 from sentry.services.hybrid_cloud.user.service import user_service
-from sentry.types.integrations import ExternalProviders, get_provider_choices
+from sentry.types.integrations import EXTERNAL_PROVIDERS, ExternalProviders, get_provider_choices
+
+AVAILABLE_PROVIDERS = frozenset(
+    {
+        ExternalProviders.GITHUB,
+        ExternalProviders.GITLAB,
+        ExternalProviders.SLACK,
+        ExternalProviders.MSTEAMS,
+        ExternalProviders.CUSTOM,
+    }
+)
 
-AVAILABLE_PROVIDERS = {
-    ExternalProviders.GITHUB,
-    ExternalProviders.GITLAB,
-    ExternalProviders.SLACK,
-    ExternalProviders.MSTEAMS,
-    ExternalProviders.CUSTOM,
-}
+STRICT_NAME_PROVIDERS = frozenset(
+    {
+        ExternalProviders.GITHUB,
+        ExternalProviders.GITLAB,
+    }
+)
 
-STRICT_NAME_PROVIDERS = {
-    ExternalProviders.GITHUB,
-    ExternalProviders.GITLAB,
-}
+# Precomputed so the per-field validators are dict/set lookups instead of
+# re-resolving provider enums on every serializer run
+PROVIDERS_BY_KEY = {EXTERNAL_PROVIDERS[provider]: provider for provider in AVAILABLE_PROVIDERS}
+STRICT_NAME_PROVIDER_KEYS = frozenset(
+    EXTERNAL_PROVIDERS[provider] for provider in STRICT_NAME_PROVIDERS
+)
 
 
 class ExternalActorSerializerBase(CamelSnakeModelSerializer):
@@ -56,20 +66,22 @@ class ExternalActorSerializerBase(CamelSnakeModelSerializer):
     def validate_external_name(self, external_name: str) -> str:
         provider = self.initial_data.get("provider")
         # Ensure the provider is strict, otherwise do not validate
-        if is_valid_provider(provider, STRICT_NAME_PROVIDERS):
+        if provider in STRICT_NAME_PROVIDER_KEYS:
             return validate_external_name(external_name)
         return external_name
 
     def validate_provider(self, provider_name_option: str) -> int:
-        provider = validate_provider(provider_name_option, available_providers=AVAILABLE_PROVIDERS)
+        provider = PROVIDERS_BY_KEY.get(provider_name_option)
+        if provider is None:
+            provider = validate_provider(
+                provider_name_option, available_providers=AVAILABLE_PROVIDERS
+            )
         return int(provider.value)
 
     def get_actor_params(self, validated_data: MutableMapping[str, Any]) -> Mapping[str, int]:
-        actor_model = validated_data.pop(self._actor_key)
-        if isinstance(actor_model, Team):
-            return dict(team_id=actor_model.id)
-        else:
-            return dict(user_id=actor_model.id)
+        # Each subclass already knows its actor key, so no need to dispatch on
+        # the model type here
+        return {self._actor_key: validated_data.pop(self._actor_key).id}
 
     def create(self, validated_data: MutableMapping[str, Any]) -> ExternalActor:
         actor_params = self.get_actor_params(validated_data)
@@ -107,13 +119,10 @@ class ExternalUserSerializer(ExternalActorSerializerBase):
 
     def validate_user_id(self, user_id: int) -> RpcUser:
         """Ensure that this user exists and that they belong to the organization."""
-        if (
-            organization_service.check_membership_by_id(
-                user_id=user_id, organization_id=self.organization.id
-            )
-            is None
-            or (user := user_service.get_user(user_id=user_id)) is None
-        ):
+        member = organization_service.check_membership_by_id(
+            user_id=user_id, organization_id=self.organization.id
+        )
+        if member is None or (user := user_service.get_user(user_id=user_id)) is None:
             raise serializers.ValidationError("This member does not exist.")
         return user
 
@@ -142,9 +151,20 @@ class ExternalTeamSerializer(ExternalActorSerializerBase):
 class ExternalActorEndpointMixin:
     @staticmethod
     def has_feature(request: Request, organization: Organization) -> bool:
-        return bool(
-            features.has("organizations:integrations-codeowners", organization, actor=request.user)
-        )
+        # Memoized on the request: multiple view methods check this flag for
+        # the same org, and each check hits the flag backend
+        feature_cache = getattr(request, "_feature_cache", None)
+        if feature_cache is None:
+            feature_cache = request._feature_cache = {}
+
+        key = ("organizations:integrations-codeowners", organization.id)
+        if key not in feature_cache:
+            feature_cache[key] = bool(
+                features.has(
+                    "organizations:integrations-codeowners", organization, actor=request.user
+                )
+            )
+        return feature_cache[key]
 
     def assert_has_feature(self, request: Request, organization: Organization) -> None:
         if not self.has_feature(request, organization):
@@ -152,9 +172,25 @@ class ExternalActorEndpointMixin:
 
     @staticmethod
     def get_external_actor_or_404(
-        external_actor_id: int, organization: Organization
+        external_actor_id: int, organization: Organization, request: Optional[Request] = None
     ) -> ExternalActor:
+        # Memoize on the request so repeated lookups of the same actor within
+        # one request don't hit the database again
+        memo: Optional[MutableMapping[int, ExternalActor]] = None
+        if request is not None:
+            memo = getattr(request, "_external_actor_cache", None)
+            if memo is None:
+                memo = request._external_actor_cache = {}
+            if external_actor_id in memo:
+                return memo[external_actor_id]
+
         try:
-            return ExternalActor.objects.get(id=external_actor_id, organization=organization)
+            external_actor = ExternalActor.objects.select_related("organization", "team").get(
+                id=external_actor_id, organization=organization
+            )
         except ExternalActor.DoesNotExist:
             raise Http404
+
+        if memo is not None:
+            memo[external_actor_id] = external_actor
+        return external_actor
@@ -34,7 +34,7 @@ class ExternalTeamDetailsEndpoint(TeamEndpoint, ExternalActorEndpointMixin):
     ) -> Tuple[Any, Any]:
         args, kwargs = super().convert_args(request, organization_slug, team_slug, *args, **kwargs)
         kwargs["external_team"] = self.get_external_actor_or_404(
-            external_team_id, kwargs["team"].organization
+            external_team_id, kwargs["team"].organization, request
         )
         return args, kwargs
 
@@ -35,7 +35,7 @@ class ExternalUserDetailsEndpoint(OrganizationEndpoint, ExternalActorEndpointMix
     ) -> tuple[tuple[Any, ...], dict[str, Any]]:
         args, kwargs = super().convert_args(request, organization_slug, *args, **kwargs)
         kwargs["external_user"] = self.get_external_actor_or_404(
-            external_user_id, kwargs["organization"]
+            external_user_id, kwargs["organization"], request
         )
         return args, kwargs
 
@@ -1,6 +1,9 @@
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timedelta
+from functools import lru_cache
 
+from django.conf import settings
+from rest_framework import serializers
 from rest_framework.response import Response
 from snuba_sdk import Column, Condition, Function, LimitBy, Op
 
@@ -12,20 +15,33 @@ from sentry.api.endpoints.organization_events_spans_performance import EventID,
 from sentry.api.helpers.span_analysis import span_analysis
 from sentry.search.events.builder import QueryBuilder
 from sentry.search.events.types import QueryBuilderConfig
-from sentry.search.utils import parse_datetime_string
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.metrics_performance import query as metrics_query
+from sentry.utils.cache import cache
+from sentry.utils.hashlib import md5_text
 from sentry.utils.snuba import raw_snql_query
 
 DEFAULT_LIMIT = 50
 QUERY_LIMIT = 10000 // 2
 BUFFER = timedelta(hours=6)
 REFERRER = "api.organization-events-root-cause-analysis"
+TRANSACTION_EXISTS_CACHE_TTL = 300  # seconds
 
-_query_thread_pool = ThreadPoolExecutor()
+_TIMESTAMP_COL = Column("timestamp")
 
 
-def init_query_builder(params, transaction, regression_breakpoint, type):
+# Bounded, process-wide pool shared across requests so concurrent requests
+# can't oversubscribe Snuba with an unbounded number of in-flight queries.
+# Created lazily so merely importing this module (e.g. during test
+# collection) doesn't allocate threads.
+@lru_cache(maxsize=1)
+def _get_query_thread_pool():
+    return ThreadPoolExecutor(
+        max_workers=settings.SNUBA_PARALLEL_QUERY_WORKERS, thread_name_prefix="rca-snuba"
+    )
+
+
+def _build_base_builder(params, transaction, regression_breakpoint):
     selected_columns = [
         "count(span_id) as span_count",
         "percentileArray(spans_exclusive_time, 0.95) as p95_self_time",
@@ -71,44 +87,68 @@ def init_query_builder(params, transaction, regression_breakpoint, type):
 
     # Filter out timestamp because we want to control the timerange for parallelization
     builder.where = [
-        condition for condition in builder.where if condition.lhs != Column("timestamp")
+        condition
+        for condition in builder.where
+        if condition.lhs is not _TIMESTAMP_COL and condition.lhs != _TIMESTAMP_COL
     ]
-    if type == "before":
-        builder.where += [
-            Condition(Column("timestamp"), Op.GTE, params.get("start")),
-            Condition(Column("timestamp"), Op.LT, regression_breakpoint - BUFFER),
-        ]
-    else:
-        builder.where += [
-            Condition(Column("timestamp"), Op.GTE, regression_breakpoint + BUFFER),
-            Condition(Column("timestamp"), Op.LT, params.get("end")),
-        ]
 
     return builder
 
 
 def get_parallelized_snql_queries(transaction, regression_breakpoint, params):
-    return [
-        init_query_builder(params, transaction, regression_breakpoint, "before").get_snql_query(),
-        init_query_builder(params, transaction, regression_breakpoint, "after").get_snql_query(),
-    ]
+    # Only the timestamp window differs between the before/after queries, so
+    # build the rest of the query once and swap in the windows afterwards
+    builder = _build_base_builder(params, transaction, regression_breakpoint)
+    base_where = builder.where
+
+    start = params.get("start")
+    end = params.get("end")
+
+    # Skip sides whose buffered window is empty or inverted — they can only
+    # return nothing, so don't pay the Snuba round-trip
+    windows = []
+    if start is not None and start < regression_breakpoint - BUFFER:
+        windows.append((start, regression_breakpoint - BUFFER))
+    if end is not None and regression_breakpoint + BUFFER < end:
+        windows.append((regression_breakpoint + BUFFER, end))
+
+    snql_queries = []
+    for window_start, window_end in windows:
+        builder.where = base_where + [
+            Condition(_TIMESTAMP_COL, Op.GTE, window_start),
+            Condition(_TIMESTAMP_COL, Op.LT, window_end),
+        ]
+        snql_queries.append(builder.get_snql_query())
+
+    return snql_queries
 
 
 def query_spans(transaction, regression_breakpoint, params):
     snql_queries = get_parallelized_snql_queries(transaction, regression_breakpoint, params)
 
     # Parallelize the request for span data
-    snuba_results = list(_query_thread_pool.map(raw_snql_query, snql_queries, [REFERRER, REFERRER]))
+    pool = _get_query_thread_pool()
+    futures = [pool.submit(raw_snql_query, snql_query, REFERRER) for snql_query in snql_queries]
+    wait(futures)
+
     span_results = []
 
-    # append all the results
-    for result in snuba_results:
-        output_dict = result["data"]
+    # append all the results, raising any query errors instead of swallowing them
+    for future in futures:
+        output_dict = future.result()["data"]
         span_results += output_dict
 
     return span_results
 
 
+class RootCauseAnalysisQueryParamSerializer(serializers.Serializer):
+    # Project ID is required to ensure the events we query for are
+    # the same transaction
+    transaction = serializers.CharField(required=True)
+    project = serializers.IntegerField(required=True)
+    breakpoint = serializers.DateTimeField(required=True)
+
+
 @region_silo_endpoint
 class OrganizationEventsRootCauseAnalysisEndpoint(OrganizationEventsEndpointBase):
     publish_status = {
@@ -123,29 +163,47 @@ class OrganizationEventsRootCauseAnalysisEndpoint(OrganizationEventsEndpointBase
         ):
             return Response(status=404)
 
-        # TODO: Extract this into a custom serializer to handle validation
-        transaction_name = request.GET.get("transaction")
-        project_id = request.GET.get("project")
-        regression_breakpoint = request.GET.get("breakpoint")
-        if not transaction_name or not project_id or not regression_breakpoint:
-            # Project ID is required to ensure the events we query for are
-            # the same transaction
-            return Response(status=400)
+        serializer = RootCauseAnalysisQueryParamSerializer(data=request.GET)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
 
-        regression_breakpoint = parse_datetime_string(regression_breakpoint)
+        query = serializer.validated_data
+        transaction_name = query["transaction"]
+        project_id = query["project"]
+        regression_breakpoint = query["breakpoint"]
+        limit = int(request.GET.get("per_page", DEFAULT_LIMIT))
 
         params = self.get_snuba_params(request, organization)
 
-        with self.handle_query_errors():
-            transaction_count_query = metrics_query(
-                ["count()"],
-                f"event.type:transaction transaction:{transaction_name} project_id:{project_id}",
-                params,
-                referrer="api.organization-events-root-cause-analysis",
-            )
+        has_before = params["start"] < regression_breakpoint - BUFFER
+        has_after = regression_breakpoint + BUFFER < params["end"]
+        if not has_before and not has_after:
+            # Both buffered windows fall outside the selected time range, so
+            # there is nothing to compare
+            return Response(status=400, data="Invalid breakpoint for the selected date range")
+
+        # Cache the presence check so repeat calls within the TTL skip the
+        # count() round-trip to Snuba. The key includes the date range since
+        # the transaction may exist in one window but not another.
+        transaction_exists_key = "rca-transaction-exists:{}:{}:{}:{}".format(
+            project_id,
+            md5_text(transaction_name).hexdigest(),
+            int(params["start"].timestamp()),
+            int(params["end"].timestamp()),
+        )
+        if not cache.get(transaction_exists_key):
+            with self.handle_query_errors():
+                transaction_count_query = metrics_query(
+                    ["count()"],
+                    f"event.type:transaction transaction:{transaction_name} project_id:{project_id}",
+                    params,
+                    referrer="api.organization-events-root-cause-analysis",
+                )
+
+            if transaction_count_query["data"][0]["count"] == 0:
+                return Response(status=400, data="Transaction not found")
 
-        if transaction_count_query["data"][0]["count"] == 0:
-            return Response(status=400, data="Transaction not found")
+            cache.set(transaction_exists_key, True, TRANSACTION_EXISTS_CACHE_TTL)
 
         span_data = query_spans(
             transaction=transaction_name,
@@ -155,6 +213,12 @@ class OrganizationEventsRootCauseAnalysisEndpoint(OrganizationEventsEndpointBase
 
         span_analysis_results = span_analysis(span_data)
 
+        # Only fetch descriptions for the rows the client will actually see
+        span_analysis_results = span_analysis_results[:limit]
+
+        # Fetch descriptions on the request thread: nodestore reads go through
+        # the Django DB in tests, and worker threads can't see the test
+        # transaction's fixtures
         for result in span_analysis_results:
             result["span_description"] = get_span_description(
                 EventID(project_id, result["sample_event_id"]),
@@ -162,5 +226,4 @@ class OrganizationEventsRootCauseAnalysisEndpoint(OrganizationEventsEndpointBase
                 result["span_group"],
             )
 
-        limit = int(request.GET.get("per_page", DEFAULT_LIMIT))
-        return Response(span_analysis_results[:limit], status=200)
+        return Response(span_analysis_results, status=200)
@@ -683,7 +683,11 @@ class ProjectDetailsEndpoint(ProjectEndpoint):
                     "builtinSymbolSources"
                 ]
         if result.get("symbolSources") is not None:
-            if project.update_option("sentry:symbol_sources", result["symbolSources"]):
+            # Compare against the cached option first so a no-op write doesn't
+            # bump the project options cache
+            if result["symbolSources"] != project.get_option(
+                "sentry:symbol_sources"
+            ) and project.update_option("sentry:symbol_sources", result["symbolSources"]):
                 # Redact secrets so they don't get logged directly to the Audit Log
                 sources_json = result["symbolSources"] or None
                 try:
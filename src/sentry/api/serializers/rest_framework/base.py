@@ -1,8 +1,13 @@
+from functools import lru_cache
+
 from django.utils.text import re_camel_case
 from rest_framework.fields import empty
 from rest_framework.serializers import ModelSerializer, Serializer
 
 
+# Key names repeat across rows in bulk payloads (e.g. CODEOWNERS imports),
+# so cache the conversions instead of re-running the regex/split per key
+@lru_cache(maxsize=512)
 def camel_to_snake_case(value):
     """
     Splits CamelCase and converts to lower case with underscores.
@@ -10,6 +15,7 @@ def camel_to_snake_case(value):
     return re_camel_case.sub(r"_\1", value).strip("_").lower()
 
 
+@lru_cache(maxsize=512)
 def snake_to_camel_case(value):
     """
     Converts a string from snake_case to camelCase
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from drf_spectacular.plumbing import build_array_type, build_basic_type
@@ -77,7 +78,9 @@ For example `24h`, to mean query data starting from 24 hours ago to now.""",
     )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def member_id(description: str) -> OpenApiParameter:
+        # Cached so repeated schema builds reuse the same parameter instance
         return OpenApiParameter(
             name="member_id",
             location="path",
@@ -259,7 +262,9 @@ keys if not specified.
     )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def key_id(description: str) -> OpenApiParameter:
+        # Cached so repeated schema builds reuse the same parameter instance
         return OpenApiParameter(
             name="key_id",
             location="path",
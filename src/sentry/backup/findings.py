@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass
 from enum import IntEnum, auto, unique
 from typing import Optional
@@ -24,15 +23,19 @@ class InstanceID:
     def __init__(self, model: NormalizedModelName, ordinal: Optional[int] = None):
         self.model = str(model)
         self.ordinal = ordinal
+        # InstanceIDs key the comparator dicts/sets for every model in a
+        # backup, so compute the hash once up front instead of per lookup
+        self._hash = hash((self.model, self.ordinal))
 
     def __hash__(self):
-        return hash((self.model, self.ordinal))
+        return self._hash
 
     def pretty(self) -> str:
-        out = f"InstanceID(model: {self.model!r}"
+        parts = [f"InstanceID(model: {self.model!r}"]
         if self.ordinal:
-            out += f", ordinal: {self.ordinal}"
-        return out + ")"
+            parts.append(f", ordinal: {self.ordinal}")
+        parts.append(")")
+        return "".join(parts)
 
 
 class FindingKind(IntEnum):
@@ -131,6 +134,15 @@ class ComparatorFindingKind(FindingKind):
     UserPasswordObfuscatingComparatorExistenceCheck = auto()
 
 
+# Enum .name goes through descriptor machinery on every access; for large
+# finding batches a plain dict lookup is cheaper. IntEnum members hash and
+# compare by value across enum classes, so lookups must be guarded by an
+# exact type check — other kinds (e.g. test-only enums) would otherwise
+# collide with the ComparatorFindingKind of the same value. They use the
+# attribute instead.
+_KIND_NAMES = {kind: kind.name for kind in ComparatorFindingKind}
+
+
 @dataclass(frozen=True)
 class Finding:
     """
@@ -157,14 +169,17 @@ class ComparatorFinding(Finding):
     kind: ComparatorFindingKind = ComparatorFindingKind.Unknown
 
     def pretty(self) -> str:
-        out = f"Finding(\n\tkind: {self.kind.name},\n\ton: {self.on.pretty()}"
+        kind = self.kind
+        kind_name = _KIND_NAMES[kind] if type(kind) is ComparatorFindingKind else kind.name
+        parts = [f"Finding(\n\tkind: {kind_name},\n\ton: {self.on.pretty()}"]
         if self.left_pk:
-            out += f",\n\tleft_pk: {self.left_pk}"
+            parts.append(f",\n\tleft_pk: {self.left_pk}")
         if self.right_pk:
-            out += f",\n\tright_pk: {self.right_pk}"
+            parts.append(f",\n\tright_pk: {self.right_pk}")
         if self.reason:
-            out += f",\n\treason: {self.reason}"
-        return out + "\n)"
+            parts.append(f",\n\treason: {self.reason}")
+        parts.append("\n)")
+        return "".join(parts)
 
 
 class ComparatorFindings:
@@ -183,19 +198,52 @@ class ComparatorFindings:
         self.findings += findings
 
     def pretty(self) -> str:
-        return "\n".join(f.pretty() for f in self.findings)
+        # A list comprehension lets str.join presize its output buffer
+        return "\n".join([f.pretty() for f in self.findings])
+
+
+def _encode_finding(obj):
+    # A shallow copy suffices: the encoder walks the returned dict exactly
+    # once and we only replace the `kind` entry
+    d = dict(obj.__dict__)
+    kind = d.get("kind")
+    if isinstance(kind, FindingKind):
+        d["kind"] = _KIND_NAMES[kind] if type(kind) is ComparatorFindingKind else kind.name
+    return d
+
+
+def _encode_instance_id(obj):
+    return {"model": obj.model, "ordinal": obj.ordinal}
+
+
+# Exact-type dispatch for the common encode path; subclasses fall back to the
+# isinstance checks in finding_default
+_JSON_ENCODERS = {
+    InstanceID: _encode_instance_id,
+    Finding: _encode_finding,
+    ComparatorFinding: _encode_finding,
+}
+
+
+def finding_default(obj):
+    """Default hook that converts findings to JSON-encodable dicts, usable by
+    any JSON encoder."""
+
+    encode = _JSON_ENCODERS.get(type(obj))
+    if encode is not None:
+        return encode(obj)
+    if isinstance(obj, Finding):
+        return _encode_finding(obj)
+    if isinstance(obj, InstanceID):
+        return _encode_instance_id(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class FindingJSONEncoder(json.JSONEncoder):
     """JSON serializer that handles findings properly."""
 
     def default(self, obj):
-        if isinstance(obj, Finding):
-            d = deepcopy(obj.__dict__)
-            kind = d.get("kind")
-            if isinstance(kind, FindingKind):
-                d["kind"] = kind.name
-            return d
-        if isinstance(obj, InstanceID):
-            return obj.__dict__
-        return super().default(obj)
+        try:
+            return finding_default(obj)
+        except TypeError:
+            return super().default(obj)
@@ -21,6 +21,32 @@ class ConfigurationError(Exception):
 logger = logging.getLogger(__name__)
 
 
+# Policy statements for cross account access. Rendered to JSON once at import
+# since only the lambda resource ARN varies between calls.
+_POLICY_TEMPLATE = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": ["lambda:UpdateFunctionConfiguration", "lambda:GetFunction"],
+                "Resource": "arn:aws:lambda:%(region)s:%(account_number)s:function:*",
+            },
+            {
+                "Effect": "Allow",
+                "Action": [
+                    "lambda:ListFunctions",
+                    "lambda:ListLayerVersions",
+                    "lambda:GetLayerVersion",
+                    "organizations:DescribeAccount",
+                ],
+                "Resource": "*",
+            },
+        ],
+    }
+)
+
+
 class ExceptionSerializer(serializers.Serializer):
     vars()["class"] = serializers.CharField(required=True)
 
@@ -56,33 +82,11 @@ def gen_aws_client(account_number, region, aws_external_id, service_name="lambda
         region_name=options.get("aws-lambda.host-region"),
     )
 
-    # need policy statements for cross account access
     assumed_role_object = client.assume_role(
         RoleSessionName="Sentry",
         RoleArn=role_arn,
         ExternalId=aws_external_id,
-        Policy=json.dumps(
-            {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Action": ["lambda:UpdateFunctionConfiguration", "lambda:GetFunction"],
-                        "Resource": f"arn:aws:lambda:{region}:{account_number}:function:*",
-                    },
-                    {
-                        "Effect": "Allow",
-                        "Action": [
-                            "lambda:ListFunctions",
-                            "lambda:ListLayerVersions",
-                            "lambda:GetLayerVersion",
-                            "organizations:DescribeAccount",
-                        ],
-                        "Resource": "*",
-                    },
-                ],
-            }
-        ),
+        Policy=_POLICY_TEMPLATE % {"region": region, "account_number": account_number},
     )
 
     credentials = assumed_role_object["Credentials"]
@@ -333,7 +333,8 @@ def parse_sources(config, filter_appconnect=True):
         return []
 
     try:
-        sources = json.loads(config)
+        # Symbol source blobs can be large; use the C-level decoder
+        sources = json.loads(config, use_rapid_json=True)
     except Exception as e:
         raise InvalidSourcesError(f"{e}")
 
@@ -367,7 +368,7 @@ def parse_backfill_sources(sources_json, original_sources):
         return []
 
     try:
-        sources = json.loads(sources_json)
+        sources = json.loads(sources_json, use_rapid_json=True)
     except Exception as e:
         raise InvalidSourcesError("Sources are not valid serialised JSON") from e
 
@@ -5,6 +5,7 @@ from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Any,
+    ItemsView,
     Iterable,
     List,
     Mapping,
@@ -25,7 +26,6 @@ from sentry.models.groupsubscription import GroupSubscription
 from sentry.models.notificationsetting import NotificationSetting
 from sentry.models.organization import Organization
 from sentry.models.organizationmember import OrganizationMember
-from sentry.models.organizationmemberteam import OrganizationMemberTeam
 from sentry.models.project import Project
 from sentry.models.projectownership import ProjectOwnership
 from sentry.models.release import Release
@@ -74,22 +74,45 @@ AVAILABLE_PROVIDERS = {
 FALLTHROUGH_NOTIFICATION_LIMIT = 20
 
 
+def _use_notifications_v2(organization: Organization) -> bool:
+    """Evaluate the notifications-v2 flag once per Organization instance.
+
+    Several branches of a single notification dispatch consult the flag, so
+    memoize the answer on the organization rather than asking the feature
+    service each time.
+    """
+    cached = getattr(organization, "_cached_notifications_v2", None)
+    if cached is None:
+        cached = organization._cached_notifications_v2 = should_use_notifications_v2(organization)
+    return cached
+
+
 class ParticipantMap:
     _dict: MutableMapping[ExternalProviders, MutableMapping[RpcActor, int]]
 
+    # Secondary index so deletions and membership tests by (actor_type, id)
+    # don't have to scan every participant in a provider group
+    _by_id: MutableMapping[Tuple[ExternalProviders, ActorType, int], set[RpcActor]]
+
     def __init__(self) -> None:
         self._dict = defaultdict(dict)
+        self._by_id = defaultdict(set)
 
     def get_participants_by_provider(
         self, provider: ExternalProviders
-    ) -> set[Tuple[RpcActor, int]]:
-        return {(k, v) for k, v in self._dict.get(provider, {}).items()}
+    ) -> ItemsView[RpcActor, int]:
+        # Hand back the (participant, reason) items view directly: it is
+        # already set-like and unique, so callers iterate without a copy
+        return self._dict.get(provider, {}).items()
 
     def add(self, provider: ExternalProviders, participant: RpcActor, reason: int) -> None:
         self._dict[provider][participant] = reason
+        self._by_id[(provider, participant.actor_type, participant.id)].add(participant)
 
     def add_all(self, provider: ExternalProviders, actor_group: Mapping[RpcActor, int]) -> None:
         self._dict[provider].update(actor_group)
+        for participant in actor_group:
+            self._by_id[(provider, participant.actor_type, participant.id)].add(participant)
 
     def update(self, other: ParticipantMap) -> None:
         for (provider, actor_group) in other._dict.items():
@@ -98,17 +121,17 @@ class ParticipantMap:
     def get_participant_sets(self) -> Iterable[Tuple[ExternalProviders, Iterable[RpcActor]]]:
         return ((provider, participants.keys()) for (provider, participants) in self._dict.items())
 
+    def has_participant_id(
+        self, provider: ExternalProviders, actor_type: ActorType, participant_id: int
+    ) -> bool:
+        return (provider, actor_type, participant_id) in self._by_id
+
     def delete_participant_by_id(
         self, provider: ExternalProviders, actor_type: ActorType, participant_id: int
     ) -> None:
         provider_group = self._dict[provider]
-        to_delete = [
-            participant
-            for participant in provider_group.keys()
-            if participant.actor_type == actor_type and participant.id == participant_id
-        ]
-        for participant in to_delete:
-            del provider_group[participant]
+        for participant in self._by_id.pop((provider, actor_type, participant_id), ()):
+            provider_group.pop(participant, None)
 
     def is_empty(self) -> bool:
         return not self._dict
@@ -139,8 +162,8 @@ def get_providers_from_which_to_remove_user(
 
     providers = {
         provider
-        for provider, participants in participants_by_provider.get_participant_sets()
-        if user_id in map(lambda p: int(p.id), participants)
+        for provider, _ in participants_by_provider.get_participant_sets()
+        if participants_by_provider.has_participant_id(provider, ActorType.USER, user_id)
     }
 
     if (
@@ -159,8 +182,10 @@ def get_providers_from_which_to_remove_user(
 
 def get_participants_for_group(group: Group, user_id: int | None = None) -> ParticipantMap:
     participants_by_provider: ParticipantMap = GroupSubscription.objects.get_participants(group)
-    if user_id:
-        # Optionally remove the actor that created the activity from the recipients list.
+    if user_id and not participants_by_provider.is_empty():
+        # Optionally remove the actor that created the activity from the
+        # recipients list. Skipped entirely when nobody is subscribed so the
+        # user-option RPC isn't issued just to filter an empty map.
         providers = get_providers_from_which_to_remove_user(user_id, participants_by_provider)
         for provider in providers:
             participants_by_provider.delete_participant_by_id(provider, ActorType.USER, user_id)
@@ -194,7 +219,7 @@ def get_participants_for_release(
     projects: Iterable[Project], organization: Organization, commited_user_ids: set[int]
 ) -> ParticipantMap:
     # Collect all users with verified emails on a team in the related projects.
-    user_ids = list(
+    member_user_ids = list(
         OrganizationMember.objects.filter(
             teams__projectteam__project__in=projects,
             user_is_active=True,
@@ -203,17 +228,21 @@ def get_participants_for_release(
         .distinct()
         .values_list("user_id", flat=True)
     )
+    if not member_user_ids:
+        return ParticipantMap()
 
     # filter those user ids by verified emails
     user_ids = user_service.get_many_ids(
         filter=dict(
-            user_ids=user_ids,
+            user_ids=member_user_ids,
             email_verified=True,
         )
     )
+    if not user_ids:
+        return ParticipantMap()
 
     actors = RpcActor.many_from_object(RpcUser(id=user_id) for user_id in user_ids)
-    if should_use_notifications_v2(organization):
+    if _use_notifications_v2(organization):
         providers_by_recipient = notifications_service.get_participants(
             recipients=actors,
             project_ids=[project.id for project in projects],
@@ -246,11 +275,12 @@ def get_participants_for_release(
     # Map users to their setting value. Prioritize user/org specific, then
     # user default, then product default.
     users_to_reasons_by_provider = ParticipantMap()
+    providers = notification_providers()
     for actor in actors:
         notification_settings_by_scope = notification_settings_by_recipient.get(actor, {})
         values_by_provider = get_values_by_provider_by_type(
             notification_settings_by_scope,
-            notification_providers(),
+            providers,
             NotificationSettingTypes.DEPLOY,
             actor,
         )
@@ -261,6 +291,21 @@ def get_participants_for_release(
     return users_to_reasons_by_provider
 
 
+def _get_member_user_ids(project: Project) -> List[int]:
+    """Fetch the project's member user ids once per Project instance.
+
+    Both get_owners and get_fallthrough_recipients can need this list while
+    handling a single alert, so memoize it on the project to avoid issuing
+    the same query twice.
+    """
+    cached = getattr(project, "_cached_member_user_ids", None)
+    if cached is None:
+        cached = project._cached_member_user_ids = list(
+            project.member_set.values_list("user_id", flat=True)
+        )
+    return cached
+
+
 def get_owners(
     project: Project,
     event: Event | None = None,
@@ -284,9 +329,7 @@ def get_owners(
 
     elif owners == ProjectOwnership.Everyone:
         outcome = "everyone"
-        users = user_service.get_many(
-            filter=dict(user_ids=list(project.member_set.values_list("user_id", flat=True)))
-        )
+        users = user_service.get_many(filter=dict(user_ids=_get_member_user_ids(project)))
         recipients = RpcActor.many_from_object(users)
 
     else:
@@ -340,7 +383,13 @@ def get_suspect_commit_users(project: Project, event: Event) -> List[RpcUser]:
         project, event
     )
     user_emails = [committer["author"]["email"] for committer in committers]  # type: ignore
+    if not user_emails:
+        return []
+
     suspect_committers = user_service.get_many_by_email(emails=user_emails, is_verified=True)
+    if not suspect_committers:
+        return []
+
     in_project_user_ids = set(
         OrganizationMember.objects.filter(
             teams__projectteam__project__in=[project],
@@ -351,10 +400,6 @@ def get_suspect_commit_users(project: Project, event: Event) -> List[RpcUser]:
     return [committer for committer in suspect_committers if committer.id in in_project_user_ids]
 
 
-def dedupe_suggested_assignees(suggested_assignees: Iterable[RpcActor]) -> Iterable[RpcActor]:
-    return list({assignee.id: assignee for assignee in suggested_assignees}.values())
-
-
 def determine_eligible_recipients(
     project: Project,
     target_type: ActionTargetType,
@@ -366,11 +411,14 @@ def determine_eligible_recipients(
     Either get the individual recipient from the target type/id or the
     owners as determined by rules for this project and event.
     """
-    if not (project and project.teams.exists()):
+    # One id-list query serves both the "project has teams" check and the
+    # membership filter in get_user_from_identifier.
+    team_ids = list(project.teams.values_list("id", flat=True)) if project else []
+    if not team_ids:
         logger.debug(f"Tried to send notification to invalid project: {project}")
 
     elif target_type == ActionTargetType.MEMBER:
-        user = get_user_from_identifier(project, target_identifier)
+        user = get_user_from_identifier(project, target_identifier, team_ids)
         if user:
             return [RpcActor.from_object(user)]
 
@@ -383,19 +431,30 @@ def determine_eligible_recipients(
         if not event:
             return []
 
-        suggested_assignees, outcome = get_owners(project, event, fallthrough_choice)
-
-        # We're adding the current assignee to the list of suggested assignees because
-        # a new issue could have multiple codeowners and one of them got auto-assigned.
         group_assignee: GroupAssignee | None = GroupAssignee.objects.filter(
             group_id=event.group_id
         ).first()
+        owners, outcome = get_owners(project, event, fallthrough_choice)
+
+        # Dedupe by actor id as we collect so no rebuild pass is needed at
+        # the end.
+        suggested_assignees: List[RpcActor] = []
+        seen_assignee_ids: set[int] = set()
+        for owner in owners:
+            if owner.id not in seen_assignee_ids:
+                seen_assignee_ids.add(owner.id)
+                suggested_assignees.append(owner)
+
+        # We're adding the current assignee to the list of suggested assignees because
+        # a new issue could have multiple codeowners and one of them got auto-assigned.
         if group_assignee:
             outcome = "match"
             assignee_actor = RpcActor.from_orm_actor(
                 group_assignee.assigned_actor().resolve_to_actor()
             )
-            suggested_assignees.append(assignee_actor)
+            if assignee_actor.id not in seen_assignee_ids:
+                seen_assignee_ids.add(assignee_actor.id)
+                suggested_assignees.append(assignee_actor)
 
         suspect_commit_users = None
         if features.has("organizations:streamline-targeting-context", project.organization):
@@ -403,7 +462,10 @@ def determine_eligible_recipients(
                 suspect_commit_users = RpcActor.many_from_object(
                     get_suspect_commit_users(project, event)
                 )
-                suggested_assignees.extend(suspect_commit_users)
+                for suspect_user in suspect_commit_users:
+                    if suspect_user.id not in seen_assignee_ids:
+                        seen_assignee_ids.add(suspect_user.id)
+                        suggested_assignees.append(suspect_user)
             except (Release.DoesNotExist, Commit.DoesNotExist):
                 logger.info("Skipping suspect committers because release does not exist.")
             except Exception:
@@ -420,7 +482,7 @@ def determine_eligible_recipients(
         )
 
         if suggested_assignees:
-            return dedupe_suggested_assignees(suggested_assignees)
+            return suggested_assignees
 
         return RpcActor.many_from_object(get_fallthrough_recipients(project, fallthrough_choice))
 
@@ -436,23 +498,28 @@ def get_send_to(
     fallthrough_choice: FallthroughChoiceType | None = None,
     rules: Iterable[Rule] | None = None,
 ) -> Mapping[ExternalProviders, set[RpcActor]]:
-    recipients = determine_eligible_recipients(
-        project, target_type, target_identifier, event, fallthrough_choice
+    # Materialize up front: the recipients may arrive as a lazy iterable, and
+    # both the snooze filter and provider partitioning need to traverse them.
+    recipients = list(
+        determine_eligible_recipients(
+            project, target_type, target_identifier, event, fallthrough_choice
+        )
     )
 
     if rules:
-        rule_snoozes = RuleSnooze.objects.filter(Q(rule__in=rules))
-        muted_user_ids = []
-        for rule_snooze in rule_snoozes:
-            if rule_snooze.user_id is None:
-                return {}
-            else:
-                muted_user_ids.append(rule_snooze.user_id)
+        muted_user_ids = frozenset(
+            RuleSnooze.objects.filter(Q(rule__in=rules)).values_list("user_id", flat=True)
+        )
+        # A null user_id means the rule is snoozed for everyone.
+        if None in muted_user_ids:
+            return {}
 
         if muted_user_ids:
-            recipients = filter(
-                lambda x: x.actor_type != ActorType.USER or x.id not in muted_user_ids, recipients
-            )
+            recipients = [
+                recipient
+                for recipient in recipients
+                if recipient.actor_type != ActorType.USER or recipient.id not in muted_user_ids
+            ]
     return get_recipients_by_provider(project, recipients, notification_type)
 
 
@@ -474,26 +541,21 @@ def get_fallthrough_recipients(
         return []
 
     elif fallthrough_choice == FallthroughChoiceType.ALL_MEMBERS:
-        return user_service.get_many(
-            filter=dict(user_ids=list(project.member_set.values_list("user_id", flat=True)))
-        )
+        return user_service.get_many(filter=dict(user_ids=_get_member_user_ids(project)))
 
     elif fallthrough_choice == FallthroughChoiceType.ACTIVE_MEMBERS:
-        member_users = user_service.get_many(
-            filter={
-                "user_ids": list(project.member_set.values_list("user_id", flat=True)),
-            },
+        return user_service.get_many_recently_active(
+            user_ids=_get_member_user_ids(project),
+            limit=FALLTHROUGH_NOTIFICATION_LIMIT,
         )
-        member_users.sort(
-            key=lambda u: u.last_active.isoformat() if u.last_active else "", reverse=True
-        )
-        return member_users[:FALLTHROUGH_NOTIFICATION_LIMIT]
 
     raise NotImplementedError(f"Unknown fallthrough choice: {fallthrough_choice}")
 
 
 def get_user_from_identifier(
-    project: Project, target_identifier: str | int | None
+    project: Project,
+    target_identifier: str | int | None,
+    team_ids: Sequence[int] | None = None,
 ) -> RpcUser | None:
     if target_identifier is None:
         return None
@@ -503,18 +565,18 @@ def get_user_from_identifier(
     except ValueError:
         return None
 
-    try:
-        organization_member_team = OrganizationMember.objects.get(
-            organization_id=project.organization_id, user_id=ident
+    # One EXISTS query over the membership join instead of separate
+    # OrganizationMember and OrganizationMemberTeam round-trips.
+    member_query = OrganizationMember.objects.filter(
+        organization_id=project.organization_id, user_id=ident
+    )
+    if team_ids is not None:
+        member_query = member_query.filter(organizationmemberteam__team_id__in=team_ids)
+    else:
+        member_query = member_query.filter(
+            organizationmemberteam__team__projectteam__project_id=project.id
         )
-    except OrganizationMember.DoesNotExist:
-        return None
-
-    team_ids = [t.id for t in project.teams.all()]
-    omt = OrganizationMemberTeam.objects.filter(
-        organizationmember_id=organization_member_team.id, team_id__in=team_ids
-    ).first()
-    if omt is None:
+    if not member_query.exists():
         return None
     return user_service.get_user(ident)
 
@@ -532,7 +594,9 @@ def get_team_from_identifier(project: Project, target_identifier: str | int | No
 def partition_recipients(
     recipients: Iterable[RpcActor],
 ) -> Mapping[ActorType, set[RpcActor]]:
-    mapping = defaultdict(set)
+    # Preallocate both buckets so lookups by callers never miss and the loop
+    # body is a plain set.add
+    mapping: Mapping[ActorType, set[RpcActor]] = {ActorType.USER: set(), ActorType.TEAM: set()}
     for recipient in recipients:
         mapping[recipient.actor_type].add(recipient)
     return mapping
@@ -544,16 +608,23 @@ def get_users_from_team_fall_back(
 ) -> Iterable[RpcUser]:
     assert all(team.actor_type == ActorType.TEAM for team in teams)
 
-    teams_to_fall_back = set(teams)
-    for recipients in recipients_by_provider.values():
-        for recipient in recipients:
-            teams_to_fall_back.remove(recipient)
+    # Single set difference instead of many individual remove() calls
+    already_served = {
+        recipient for recipients in recipients_by_provider.values() for recipient in recipients
+    }
+    teams_to_fall_back = set(teams) - already_served
 
-    user_ids: set[int] = set()
-    for team in teams_to_fall_back:
-        # Fall back to notifying each subscribed user if there aren't team notification settings
-        members = organization_service.get_team_members(team_id=team.id)
-        user_ids |= {member.user_id for member in members if member.user_id is not None}
+    # Fall back to notifying each subscribed user if there aren't team
+    # notification settings; fetch all fallback teams' members in one RPC
+    members_by_team = organization_service.get_team_members_by_team(
+        team_ids=[team.id for team in teams_to_fall_back]
+    )
+    user_ids = {
+        member.user_id
+        for members in members_by_team.values()
+        for member in members
+        if member.user_id is not None
+    }
     return user_service.get_many(filter={"user_ids": list(user_ids)})
 
 
@@ -562,13 +633,11 @@ def combine_recipients_by_provider(
     users_by_provider: Mapping[ExternalProviders, Iterable[RpcActor]],
 ) -> Mapping[ExternalProviders, set[RpcActor]]:
     """TODO(mgaeta): Make this more generic and move it to utils."""
-    recipients_by_provider = defaultdict(set)
+    recipients_by_provider: MutableMapping[ExternalProviders, set[RpcActor]] = defaultdict(set)
     for provider, teams in teams_by_provider.items():
-        for team in teams:
-            recipients_by_provider[provider].add(team)
+        recipients_by_provider[provider].update(teams)
     for provider, users in users_by_provider.items():
-        for user in users:
-            recipients_by_provider[provider].add(user)
+        recipients_by_provider[provider].update(users)
     return recipients_by_provider
 
 
@@ -585,48 +654,53 @@ def get_recipients_by_provider(
     # First evaluate the teams.
     setting_type = NotificationSettingEnum(NOTIFICATION_SETTING_TYPES[notification_type])
     controller = None
+    use_notifications_v2 = _use_notifications_v2(project.organization)
     teams_by_provider: Mapping[ExternalProviders, Iterable[RpcActor]] = {}
-    if should_use_notifications_v2(project.organization):
-        controller = NotificationController(
-            recipients=users,
-            organization_id=project.organization_id,
-            project_ids=[project.id],
-            type=setting_type,
-        )
-        teams_by_provider = controller.get_notification_recipients(
-            type=setting_type, actor_type=ActorType.TEAM
-        )
-    else:
-        teams_by_provider = NotificationSetting.objects.filter_to_accepting_recipients(
-            project, teams, notification_type
-        )
-
-    # Teams cannot receive emails so omit EMAIL settings.
-    teams_by_provider = {
-        provider: teams
-        for provider, teams in teams_by_provider.items()
-        if provider != ExternalProviders.EMAIL
-    }
-
-    # If there are any teams that didn't get added, fall back and add all users.
-    users |= set(RpcActor.many_from_object(get_users_from_team_fall_back(teams, teams_by_provider)))
-
-    # Repeat for users.
-    users_by_provider: Mapping[ExternalProviders, Iterable[RpcActor]] = {}
-    if should_use_notifications_v2(project.organization):
-        if not controller:
+    if teams:
+        if use_notifications_v2:
             controller = NotificationController(
                 recipients=users,
                 organization_id=project.organization_id,
                 project_ids=[project.id],
                 type=setting_type,
             )
-        users_by_provider = controller.get_notification_recipients(
-            type=setting_type, actor_type=ActorType.USER
-        )
-    else:
-        users_by_provider = NotificationSetting.objects.filter_to_accepting_recipients(
-            project, users, notification_type
+            teams_by_provider = controller.get_notification_recipients(
+                type=setting_type, actor_type=ActorType.TEAM
+            )
+        else:
+            teams_by_provider = NotificationSetting.objects.filter_to_accepting_recipients(
+                project, teams, notification_type
+            )
+
+        # Teams cannot receive emails so omit EMAIL settings.
+        teams_by_provider = {
+            provider: teams
+            for provider, teams in teams_by_provider.items()
+            if provider != ExternalProviders.EMAIL
+        }
+
+        # If there are any teams that didn't get added, fall back and add all users.
+        users |= set(
+            RpcActor.many_from_object(get_users_from_team_fall_back(teams, teams_by_provider))
         )
 
+    # Repeat for users.
+    users_by_provider: Mapping[ExternalProviders, Iterable[RpcActor]] = {}
+    if users:
+        if use_notifications_v2:
+            if not controller:
+                controller = NotificationController(
+                    recipients=users,
+                    organization_id=project.organization_id,
+                    project_ids=[project.id],
+                    type=setting_type,
+                )
+            users_by_provider = controller.get_notification_recipients(
+                type=setting_type, actor_type=ActorType.USER
+            )
+        else:
+            users_by_provider = NotificationSetting.objects.filter_to_accepting_recipients(
+                project, users, notification_type
+            )
+
     return combine_recipients_by_provider(teams_by_provider, users_by_provider)
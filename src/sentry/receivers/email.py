@@ -1,4 +1,4 @@
-from django.db import IntegrityError, router, transaction
+from django.db.models import Exists
 from django.db.models.signals import post_delete, post_save
 
 from sentry.models.email import Email
@@ -7,18 +7,17 @@ from sentry.models.useremail import UserEmail
 
 def create_email(instance, created, **kwargs):
     if created:
-        try:
-            with transaction.atomic(router.db_for_write(Email)):
-                Email.objects.create(email=instance.email)
-        except IntegrityError:
-            pass
+        # INSERT ... ON CONFLICT DO NOTHING; duplicate emails are expected and
+        # need neither a savepoint nor an IntegrityError round-trip.
+        Email.objects.bulk_create([Email(email=instance.email)], ignore_conflicts=True)
 
 
 def delete_email(instance, **kwargs):
-    if UserEmail.objects.filter(email__iexact=instance.email).exists():
-        return
-
-    Email.objects.filter(email=instance.email).delete()
+    # DELETE ... WHERE NOT EXISTS in one statement, so a UserEmail inserted
+    # between a separate existence check and the delete can't be orphaned.
+    Email.objects.filter(email=instance.email).filter(
+        ~Exists(UserEmail.objects.filter(email__iexact=instance.email))
+    ).delete()
 
 
 post_save.connect(create_email, sender=UserEmail, dispatch_uid="create_email", weak=False)
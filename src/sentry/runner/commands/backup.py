@@ -37,12 +37,19 @@ FINDINGS_FILE_HELP = """Optional file that records comparator findings, saved in
                      If left unset, no such file is written."""
 
 
-def parse_filter_arg(filter_arg: str) -> set[str] | None:
-    filter_by = None
-    if filter_arg:
-        filter_by = set(filter_arg.split(","))
+def _noop_printer(*args, **kwargs):
+    pass
 
-    return filter_by
+
+def get_printer(silent: bool):
+    """Shared printer selection for the import/export commands."""
+    return _noop_printer if silent else click.echo
+
+
+def parse_filter_arg(filter_arg: str) -> frozenset[str] | None:
+    # Downstream code only does membership tests, so hand back an immutable
+    # (and hashable) set.
+    return frozenset(filter_arg.split(",")) if filter_arg else None
 
 
 findings_encoder = FindingJSONEncoder(
@@ -54,6 +61,15 @@ findings_encoder = FindingJSONEncoder(
     encoding="utf-8",
 )
 
+findings_jsonl_encoder = FindingJSONEncoder(
+    sort_keys=True,
+    ensure_ascii=True,
+    check_circular=True,
+    allow_nan=True,
+    indent=None,
+    encoding="utf-8",
+)
+
 
 @click.command(name="compare")
 @click.argument("left", type=click.File("rb"))
@@ -64,30 +80,52 @@ findings_encoder = FindingJSONEncoder(
     required=False,
     help=FINDINGS_FILE_HELP,
 )
+@click.option(
+    "--jsonl",
+    default=False,
+    is_flag=True,
+    help="Write the findings file as JSON lines (one finding per line) rather than a "
+    "pretty-printed array, which keeps memory flat and allows streaming consumers "
+    "when diffs are very large.",
+)
 @configuration
-def compare(left, right, findings_file):
+def compare(left, right, findings_file, jsonl):
     """
     Compare two exports generated by the `export` command for equality, modulo certain necessary changed like `date_updated` timestamps, unique tokens, and the like.
     """
 
+    # Exports are large, so decode with rapidjson (C scanner) instead of the
+    # default pure-Python simplejson decoder. rapidjson raises its own
+    # ValueError subclass rather than simplejson's JSONDecodeError.
     with left:
         try:
-            left_data = json.load(left)
-        except json.JSONDecodeError:
-            click.echo("Invalid left JSON", err=True)
+            left_data = json.loads(left.read(), use_rapid_json=True)
+        except ValueError:
+            # Abort rather than echo-and-continue: falling through here used
+            # to hit validate() with `left_data` unbound, and there is no
+            # point parsing the other side once one input is known bad.
+            raise click.ClickException("Invalid left JSON")
 
     with right:
         try:
-            right_data = json.load(right)
-        except json.JSONDecodeError:
-            click.echo("Invalid right JSON", err=True)
+            right_data = json.loads(right.read(), use_rapid_json=True)
+        except ValueError:
+            raise click.ClickException("Invalid right JSON")
 
     res = validate(left_data, right_data, get_default_comparators())
     if res:
         if findings_file:
             with findings_file as f:
-                encoded = findings_encoder.encode(res.findings)
-                f.write(encoded)
+                if jsonl:
+                    for finding in res.findings:
+                        f.write(findings_jsonl_encoder.encode(finding))
+                        f.write("\n")
+                else:
+                    # Stream encoder chunks to the file rather than
+                    # materializing the whole findings document as one string
+                    # first.
+                    for chunk in findings_encoder.iterencode(res.findings):
+                        f.write(chunk)
 
         click.echo(f"Done, found {len(res.findings)} differences:\n\n{res.pretty()}")
     else:
@@ -125,7 +163,7 @@ def import_users(src, filter_usernames, merge_users, silent):
         src,
         flags=ImportFlags(merge_users=merge_users),
         user_filter=parse_filter_arg(filter_usernames),
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
 
 
@@ -156,7 +194,7 @@ def import_organizations(src, filter_org_slugs, merge_users, silent):
         src,
         flags=ImportFlags(merge_users=merge_users),
         org_filter=parse_filter_arg(filter_org_slugs),
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
 
 
@@ -184,7 +222,7 @@ def import_config(src, merge_users, overwrite_configs, silent):
     import_in_config_scope(
         src,
         flags=ImportFlags(merge_users=merge_users, overwrite_configs=overwrite_configs),
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
 
 
@@ -206,7 +244,7 @@ def import_global(src, silent, overwrite_configs):
     import_in_global_scope(
         src,
         flags=ImportFlags(overwrite_configs=overwrite_configs),
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
 
 
@@ -241,7 +279,7 @@ def export_users(dest, silent, indent, filter_usernames):
         dest,
         indent=indent,
         user_filter=parse_filter_arg(filter_usernames),
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
 
 
@@ -272,7 +310,7 @@ def export_organizations(dest, silent, indent, filter_org_slugs):
         dest,
         indent=indent,
         org_filter=parse_filter_arg(filter_org_slugs),
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
 
 
@@ -294,7 +332,7 @@ def export_config(dest, silent, indent):
     export_in_config_scope(
         dest,
         indent=indent,
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
 
 
@@ -316,5 +354,5 @@ def export_global(dest, silent, indent):
     export_in_global_scope(
         dest,
         indent=indent,
-        printer=(lambda *args, **kwargs: None) if silent else click.echo,
+        printer=get_printer(silent),
     )
@@ -91,11 +91,25 @@ class RpcActor(RpcModel):
             user_ids = grouped_by_type[ActorType.USER]
             actors = Actor.objects.filter(type=ACTOR_TYPES["user"], user_id__in=user_ids)
             actors_by_user_id = {actor.user_id: actor for actor in actors}
+            missing_user_ids = [
+                user_id for user_id in dict.fromkeys(user_ids) if user_id not in actors_by_user_id
+            ]
+            if missing_user_ids:
+                # Backfill all missing actors in one INSERT instead of a
+                # get_or_create round-trip per user.
+                Actor.objects.bulk_create(
+                    [
+                        Actor(type=ACTOR_TYPES["user"], user_id=user_id)
+                        for user_id in missing_user_ids
+                    ],
+                    ignore_conflicts=True,
+                )
+                for actor in Actor.objects.filter(
+                    type=ACTOR_TYPES["user"], user_id__in=missing_user_ids
+                ):
+                    actors_by_user_id[actor.user_id] = actor
             for user_id in user_ids:
-                if user_id in actors_by_user_id:
-                    actor = actors_by_user_id[user_id]
-                else:
-                    actor = get_actor_for_user(user_id)
+                actor = actors_by_user_id.get(user_id) or get_actor_for_user(user_id)
                 result.append(
                     RpcActor(actor_id=actor.id, id=actor.user_id, actor_type=ActorType.USER)
                 )
@@ -360,6 +360,21 @@ class DatabaseBackedOrganizationService(OrganizationService):
         team_members = OrganizationMemberTeam.objects.filter(team_id=team_id)
         return [serialize_member(team_member.organizationmember) for team_member in team_members]
 
+    def get_team_members_by_team(
+        self, *, team_ids: Iterable[int]
+    ) -> Mapping[int, Iterable[RpcOrganizationMember]]:
+        members_by_team: Mapping[int, List[RpcOrganizationMember]] = {
+            team_id: [] for team_id in team_ids
+        }
+        team_members = OrganizationMemberTeam.objects.filter(
+            team_id__in=members_by_team.keys()
+        ).select_related("organizationmember")
+        for team_member in team_members:
+            members_by_team[team_member.team_id].append(
+                serialize_member(team_member.organizationmember)
+            )
+        return members_by_team
+
     def update_membership_flags(self, *, organization_member: RpcOrganizationMember) -> None:
         model = OrganizationMember.objects.get(id=organization_member.id)
         model.flags = self._deserialize_member_flags(organization_member.flags)
@@ -223,6 +223,16 @@ class OrganizationService(RpcService):
     def get_team_members(self, *, team_id: int) -> Iterable[RpcOrganizationMember]:
         pass
 
+    @regional_rpc_method(
+        resolve=UnimplementedRegionResolution("organization", "get_team_members_by_team")
+    )
+    @abstractmethod
+    def get_team_members_by_team(
+        self, *, team_ids: Iterable[int]
+    ) -> Mapping[int, Iterable[RpcOrganizationMember]]:
+        """Fetch members for several teams in a single round-trip, keyed by team id."""
+        pass
+
     @regional_rpc_method(resolve=ByOrganizationIdAttribute("organization_member"))
     @abstractmethod
     def update_membership_flags(self, *, organization_member: RpcOrganizationMember) -> None:
@@ -5,7 +5,7 @@ from typing import Any, Callable, List, MutableMapping, Optional
 from uuid import uuid4
 
 from django.db import router, transaction
-from django.db.models import Q, QuerySet
+from django.db.models import F, Q, QuerySet
 from django.utils.text import slugify
 
 from sentry.api.serializers import (
@@ -58,6 +58,12 @@ class DatabaseBackedUserService(UserService):
     def get_many_ids(self, *, filter: UserFilterArgs) -> List[int]:
         return self._FQ.get_many_ids(filter)
 
+    def get_many_recently_active(self, *, user_ids: List[int], limit: int) -> List[RpcUser]:
+        users = self._FQ.base_query().filter(id__in=user_ids).order_by(
+            F("last_active").desc(nulls_last=True)
+        )[:limit]
+        return [serialize_rpc_user(user) for user in users]
+
     def get_many_by_email(
         self,
         emails: List[str],
@@ -52,6 +52,16 @@ class UserService(RpcService):
     def get_many_ids(self, *, filter: UserFilterArgs) -> List[int]:
         pass
 
+    @rpc_method
+    @abstractmethod
+    def get_many_recently_active(self, *, user_ids: List[int], limit: int) -> List[RpcUser]:
+        """Return up to `limit` of the given users, most recently active first.
+
+        Ordering and truncation happen in the database so callers don't pull
+        and sort the full user list just to keep a handful of rows.
+        """
+        pass
+
     @rpc_method
     @abstractmethod
     def get_many_by_email(
@@ -56,33 +56,33 @@ class AwsLambdaClientTest(TestCase):
 
         role_arn = "arn:aws:iam::599817902985:role/SentryRole"
 
-        mock_client.assume_role.assert_called_once_with(
-            RoleSessionName="Sentry",
-            RoleArn=role_arn,
-            ExternalId=aws_external_id,
-            Policy=json.dumps(
+        mock_client.assume_role.assert_called_once()
+        call_kwargs = mock_client.assume_role.call_args.kwargs
+        assert call_kwargs["RoleSessionName"] == "Sentry"
+        assert call_kwargs["RoleArn"] == role_arn
+        assert call_kwargs["ExternalId"] == aws_external_id
+        # Compare the policy structurally so the assertion doesn't depend on
+        # key order or serializer formatting.
+        assert json.loads(call_kwargs["Policy"]) == {
+            "Version": "2012-10-17",
+            "Statement": [
                 {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Action": ["lambda:UpdateFunctionConfiguration", "lambda:GetFunction"],
-                            "Resource": "arn:aws:lambda:us-west-1:599817902985:function:*",
-                        },
-                        {
-                            "Effect": "Allow",
-                            "Action": [
-                                "lambda:ListFunctions",
-                                "lambda:ListLayerVersions",
-                                "lambda:GetLayerVersion",
-                                "organizations:DescribeAccount",
-                            ],
-                            "Resource": "*",
-                        },
+                    "Effect": "Allow",
+                    "Action": ["lambda:UpdateFunctionConfiguration", "lambda:GetFunction"],
+                    "Resource": "arn:aws:lambda:us-west-1:599817902985:function:*",
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "lambda:ListFunctions",
+                        "lambda:ListLayerVersions",
+                        "lambda:GetLayerVersion",
+                        "organizations:DescribeAccount",
                     ],
-                }
-            ),
-        )
+                    "Resource": "*",
+                },
+            ],
+        }
 
         mock_get_session.assert_called_once_with(
             aws_access_key_id=credentials["AccessKeyId"],
@@ -94,14 +94,13 @@ class AwsLambdaClientTest(TestCase):
 
 
 def assert_proxy_request(request, is_proxy=True):
+    # One header probe each; presence already implies a non-None value.
     assert (PROXY_BASE_PATH in request.url) == is_proxy
-    assert (PROXY_OI_HEADER in request.headers) == is_proxy
-    assert (PROXY_SIGNATURE_HEADER in request.headers) == is_proxy
+    assert (request.headers.get(PROXY_OI_HEADER) is not None) == is_proxy
+    assert (request.headers.get(PROXY_SIGNATURE_HEADER) is not None) == is_proxy
     # AWS Lambda API does not require the Authorization header.
     # The secret is instead passed in the body payload called routing_key/integration key
     assert "Authorization" not in request.headers
-    if is_proxy:
-        assert request.headers[PROXY_OI_HEADER] is not None
 
 
 class SiloHttpHeaders(TypedDict, total=False):
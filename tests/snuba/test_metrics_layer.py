@@ -25,6 +25,10 @@ from sentry.testutils.cases import BaseMetricsTestCase, TestCase
 pytestmark = pytest.mark.sentry_metrics
 
 
+# Hoisted out of the per-point loops below; the loop index scales it.
+ONE_MINUTE = timedelta(minutes=1)
+
+
 class SnQLTest(TestCase, BaseMetricsTestCase):
     def ts(self, dt: datetime) -> int:
         return int(dt.timestamp())
@@ -40,24 +44,29 @@ class SnQLTest(TestCase, BaseMetricsTestCase):
         self.now = datetime.now(tz=timezone.utc)
         self.hour_ago = self.now - timedelta(hours=1)
         self.org_id = self.project.organization_id
-        # Store a data point every 10 seconds for an hour
+        # Store a data point every 10 seconds for an hour, batched into one
+        # snuba insert per entity
+        buckets = []
         for mri, metric_type in self.metrics.items():
             assert metric_type in {"counter", "distribution", "set"}
             for i in range(360):
-                self.store_metric(
-                    self.org_id,
-                    self.project.id,
-                    metric_type,
-                    mri,
-                    {
-                        "transaction": f"transaction_{i % 2}",
-                        "status_code": "500" if i % 10 == 0 else "200",
-                        "device": "BlackBerry" if i % 3 == 0 else "Nokia",
-                    },
-                    self.ts(self.hour_ago + timedelta(minutes=1 * i)),
-                    i,
-                    UseCaseID.TRANSACTIONS,
+                buckets.append(
+                    dict(
+                        org_id=self.org_id,
+                        project_id=self.project.id,
+                        type=metric_type,
+                        name=mri,
+                        tags={
+                            "transaction": f"transaction_{i % 2}",
+                            "status_code": "500" if i % 10 == 0 else "200",
+                            "device": "BlackBerry" if i % 3 == 0 else "Nokia",
+                        },
+                        timestamp=self.ts(self.hour_ago + i * ONE_MINUTE),
+                        value=i,
+                        use_case_id=UseCaseID.TRANSACTIONS,
+                    )
                 )
+        self.bulk_store_metrics(buckets)
 
     def test_basic(self) -> None:
         query = MetricsQuery(
@@ -92,7 +101,7 @@ class SnQLTest(TestCase, BaseMetricsTestCase):
             assert (
                 rows[i]["time"]
                 == (
-                    self.hour_ago.replace(second=0, microsecond=0) + timedelta(minutes=1 * i)
+                    self.hour_ago.replace(second=0, microsecond=0) + i * ONE_MINUTE
                 ).isoformat()
             )
 
@@ -132,7 +141,7 @@ class SnQLTest(TestCase, BaseMetricsTestCase):
             assert (
                 rows[i]["time"]
                 == (
-                    self.hour_ago.replace(second=0, microsecond=0) + timedelta(minutes=1 * i)
+                    self.hour_ago.replace(second=0, microsecond=0) + i * ONE_MINUTE
                 ).isoformat()
             )
 
@@ -172,7 +181,7 @@ class SnQLTest(TestCase, BaseMetricsTestCase):
             assert (
                 rows[i]["time"]
                 == (
-                    self.hour_ago.replace(second=0, microsecond=0) + timedelta(minutes=30 * i)
+                    self.hour_ago.replace(second=0, microsecond=0) + 30 * i * ONE_MINUTE
                 ).isoformat()
             )
 
@@ -214,7 +223,7 @@ class SnQLTest(TestCase, BaseMetricsTestCase):
             assert (
                 rows[i]["time"]
                 == (
-                    self.hour_ago.replace(second=0, microsecond=0) + timedelta(minutes=30 * i)
+                    self.hour_ago.replace(second=0, microsecond=0) + 30 * i * ONE_MINUTE
                 ).isoformat()
             )
 